@@ -10,163 +10,127 @@ Released under an MIT licence
 # pylint: disable=unused-argument
 # pylint: disable=invalid-name
 
+import array
 import sys
-import re
 
 
-def stop(pointer, main_stack, aux_stack):
+class State:
+    """
+    The state of the interpreter: the position of the pointer in the
+    chromosome, and the contents of the main and auxiliary stacks.
+    Amino acid functions modify this in place.
+    """
+    __slots__ = ('pointer', 'main', 'aux')
+
+    def __init__(self, pointer, main_stack, aux_stack):
+        self.pointer = pointer
+        self.main = main_stack
+        self.aux = aux_stack
+
+
+def stop(state):
     """
     Stop
     Terminate execution.
     """
-    if VERBOSE:
-        print("Stop", main_stack, aux_stack)
     sys.exit(0)
 
 
 # Charged amino acids: Single-stack operations
 
 
-def his(pointer, main_stack, aux_stack):
+def his(state):
     """
     His
     Treat next codon as an integer literal in quaternary notation.
     Push the value to the main stack.
     """
-    codon, pointer = read_next_codon(pointer)
-    if VERBOSE:
-        print("His", main_stack, aux_stack, codon)
-    main_stack.append(codon_to_int(codon))
-    return(pointer, main_stack, aux_stack)
+    state.main.append(CODONS[state.pointer % CHROMLEN])
+    state.pointer += 3
 
 
-def lys(pointer, main_stack, aux_stack):
+def lys(state):
     """
     Lys
     If the main stack is non-empty, pop the top element as a number.
     """
-    if VERBOSE:
-        print("Lys", main_stack, aux_stack)
     # If the stack is empty, do nothing
-    if main_stack:
-        print(main_stack.pop())
-    return(pointer, main_stack, aux_stack)
+    if state.main:
+        print(state.main.pop())
 
 
-def arg(pointer, main_stack, aux_stack):
+def arg(state):
     """
     Arg
     If the main stack is non-empty, pop the top element.
     If it is positive, round it towards zero and print it as a Unicode
     character.
     """
-    if VERBOSE:
-        print("Arg", main_stack, aux_stack)
-    if main_stack:
-        char = int(main_stack.pop())
+    if state.main:
+        char = int(state.main.pop())
         if char >= 0:
             try:
-                sys.stdout.write(str(chr(char)))
+                sys.stdout.write(chr(char))
             # If the value is too large, don't print it
             except (ValueError, OverflowError, UnicodeEncodeError):
                 pass
-    return(pointer, main_stack, aux_stack)
 
 
-def glu(pointer, main_stack, aux_stack):
+def glu(state):
     """
     Glu
     If the main stack is non-empty, duplicate the top element.
     """
-    if VERBOSE:
-        print("Glu", main_stack, aux_stack)
-    if main_stack:
-        main_stack.append(main_stack[-1])
-    return(pointer, main_stack, aux_stack)
+    if state.main:
+        state.main.append(state.main[-1])
 
 
-def asp(pointer, main_stack, aux_stack):
+def asp(state):
     """
     Asp
     If the main stack is non-empty, drop the top element.
     """
-    if VERBOSE:
-        print("Asp", main_stack, aux_stack)
-    if main_stack:
-        main_stack = main_stack[:-1]
-    return(pointer, main_stack, aux_stack)
+    if state.main:
+        state.main.pop()
 
 
 # Non-polar amino acids: Two-stack operations
 
 
-def leu(pointer, main_stack, aux_stack):
+def leu(state):
     """
     Leu
     Add the top elements of each stack.
     Place the result in the main stack.
     If either stack is empty, treat it as zero.
     """
-    if VERBOSE:
-        print("Leu", main_stack, aux_stack)
-    # If either list is empty, treat it as zero
-    if main_stack:
-        a = int(main_stack.pop())
-    else:
-        a = 0
-    if aux_stack:
-        b = int(aux_stack.pop())
-    else:
-        b = 0
-    main_stack.append(a + b)
-    return(pointer, main_stack, aux_stack)
+    a, b = operands(state, 0)
+    state.main[-1] = a + b
 
 
-def ile(pointer, main_stack, aux_stack):
+def ile(state):
     """
     Ile
     Subtract the top of the aux stack from the top of the main stack.
     Place the result in the main stack.
     If either stack is empty, treat it as zero.
     """
-    if VERBOSE:
-        print("Ile", main_stack, aux_stack)
-    # If either list is empty, treat it as zero
-    if main_stack:
-        a = int(main_stack.pop())
-    else:
-        a = 0
-    if aux_stack:
-        b = int(aux_stack.pop())
-    else:
-        b = 0
-    main_stack.append(a - b)
-    return(pointer, main_stack, aux_stack)
+    a, b = operands(state, 0)
+    state.main[-1] = a - b
 
 
-def val(pointer, main_stack, aux_stack):
+def val(state):
     """
     Val
     Multiply the top elements of the two stacks.
     Place the result in the main stack.
     If either stack is empty, treat it as one.
     """
-    if VERBOSE:
-        print("Ile", main_stack, aux_stack)
-    # If either list is empty, treat it as one
-    if main_stack:
-        a = int(main_stack.pop())
-    else:
-        a = 1
-    if aux_stack:
-        b = int(aux_stack.pop())
-    else:
-        b = 1
-    main_stack.append(a * b)
-    return(pointer, main_stack, aux_stack)
+    a, b = operands(state, 1)
+    state.main[-1] = a * b
 
 
-def pro(pointer, main_stack, aux_stack):
+def pro(state):
     """
     Pro
     Divide the top of the main stack by the top of the aux stack.
@@ -174,98 +138,80 @@ def pro(pointer, main_stack, aux_stack):
     Place the result in the main stack.
     If either stack is empty, treat it as one.
     """
-    if VERBOSE:
-        print("Pro", main_stack, aux_stack)
-    # If either list is empty, treat it as one
-    if main_stack:
-        a = int(main_stack.pop())
-    else:
-        a = 1
-    if aux_stack:
-        b = int(aux_stack.pop())
-    else:
-        b = 1
+    a, b = operands(state, 1)
     try:
-        main_stack.append(a / b)
+        state.main[-1] = a / b
     # Fall back to integer division if the result doesn't fit in a float
     except OverflowError:
-        main_stack.append(a // b)
+        state.main[-1] = a // b
     except ZeroDivisionError:
-        main_stack.append(a)
-    return(pointer, main_stack, aux_stack)
+        state.main[-1] = a
 
 
-def met(pointer, main_stack, aux_stack):
+def met(state):
     """
     Met
     Swap the top elements of the two stacks.
     Gracefully handles empty stacks.
     """
-    if VERBOSE:
-        print("Met", main_stack, aux_stack)
+    main_stack, aux_stack = state.main, state.aux
+    # If both lists are non-empty, exchange the top elements in place
+    if main_stack and aux_stack:
+        main_stack[-1], aux_stack[-1] = aux_stack[-1], main_stack[-1]
     # If either list is empty, just move one way
     # If both are empty, do nothing
-    a = None
-    if main_stack:
-        a = main_stack.pop()
-    if aux_stack:
+    elif main_stack:
+        aux_stack.append(main_stack.pop())
+    elif aux_stack:
         main_stack.append(aux_stack.pop())
-    if a is not None:
-        aux_stack.append(a)
-    return(pointer, main_stack, aux_stack)
 
 
-def phe(pointer, main_stack, aux_stack):
+def phe(state):
     """
     Phe
     Put aux stack on top of main stack, preserving its order
     """
-    if VERBOSE:
-        print("Phe", main_stack, aux_stack)
-    main_stack += aux_stack
-    aux_stack = []
-    return(pointer, main_stack, aux_stack)
+    state.main.extend(state.aux)
+    state.aux.clear()
 
 
-def gly(pointer, main_stack, aux_stack):
+def gly(state):
     """
     Gly
     If the main stack is non-empty, move the top element to the aux stack.
     """
-    if VERBOSE:
-        print("Gly", main_stack, aux_stack)
-    if main_stack:
-        aux_stack.append(main_stack.pop())
-    return(pointer, main_stack, aux_stack)
+    if state.main:
+        state.aux.append(state.main.pop())
 
 
-def trp(pointer, main_stack, aux_stack):
+def trp(state):
     """
     Trp
     Take the top element of the main stack to the power of the top element of
     the auxiliary stack.
     If either stack is empty, treat it as zero.
     """
-    if VERBOSE:
-        print("Trp", main_stack, aux_stack)
-    if main_stack:
-        a = main_stack.pop()
-    else:
-        a = 0
+    main_stack, aux_stack = state.main, state.aux
+    if not main_stack:
+        main_stack.append(0)
     if aux_stack:
         b = aux_stack.pop()
     else:
         b = 0
+    # Replace the top of the main stack with the result in place
+    a = main_stack[-1]
     # If trying to raise 0 to a negative power, act as a no-op
     if (a != 0 or b >= 0):
         try:
-            main_stack.append(a ** b)
+            main_stack[-1] = a ** b
+            return
         except OverflowError:
             pass
-    return(pointer, main_stack, aux_stack)
+    # If there is no result, both operands are still consumed
+    main_stack.pop()
 
 
-def ala(pointer, main_stack, aux_stack):
+def ala(state):
     """
     Ala
     Calculate main top modulo aux top.
@@ -273,213 +219,293 @@ def ala(pointer, main_stack, aux_stack):
     If the main stack is empty, treat it as zero.
     If the aux stack is empty, treat it as one.
     """
-    if VERBOSE:
-        print("Ala", main_stack, aux_stack)
+    main_stack, aux_stack = state.main, state.aux
     # If either list is empty, treat it as zero
-    if main_stack:
-        a = int(main_stack.pop())
-    else:
-        a = 0
+    if not main_stack:
+        main_stack.append(0)
     if aux_stack and aux_stack[-1] != 0:
         b = int(aux_stack.pop())
     else:
         b = 1
+    # Replace the top of the main stack with the result in place
     try:
-        main_stack.append(a % b)
+        main_stack[-1] = int(main_stack[-1]) % b
+    # A fractional divisor can still truncate to zero; just drop the dividend
     except ZeroDivisionError:
-        pass
-    return(pointer, main_stack, aux_stack)
+        main_stack.pop()
 
 
 # Polar amino acids: Flow control
 
 
-def ser(pointer, main_stack, aux_stack):
+def ser(state):
     """
     Ser
     If the top element of the main stack is <= 0, jump to next occurrence of
     the following codon.
     """
-    term, pointer = read_next_codon(pointer)
-    if VERBOSE:
-        print("Ser", main_stack, aux_stack, term)
-    if main_stack and (main_stack[-1] <= 0):
-        results = []
-        result, success = look_ahead(pointer, term)
+    term = CODONS[state.pointer % CHROMLEN]
+    state.pointer += 3
+    if state.main and (state.main[-1] <= 0):
+        result, success = look_ahead(state.pointer, term)
         if success:
-            results.append(result - pointer)
-        if results:
-            pointer += min(results) + 1
-    return(pointer, main_stack, aux_stack)
+            state.pointer = result + 1
 
 
-def thr(pointer, main_stack, aux_stack):
+def thr(state):
     """
     Thr
     If the top element of the main stack is <= 0, jump back to previous
     occurrence of the following codon.
     """
-    term, _ = read_next_codon(pointer)
-    if VERBOSE:
-        print("Thr", main_stack, aux_stack, term)
-    if main_stack and (main_stack[-1] <= 0):
-        results = []
-        result, success = look_back(pointer, term)
-
+    term = CODONS[state.pointer % CHROMLEN]
+    if state.main and (state.main[-1] <= 0):
+        result, success = look_back(state.pointer, term)
         if success:
-            results.append(pointer - result)
-
-        if results:
-            pointer -= min(results) - 1
+            state.pointer = result + 1
         else:
-            pointer += 3
-    return(pointer, main_stack, aux_stack)
+            state.pointer += 3
 
 
-def tyr(pointer, main_stack, aux_stack):
+def tyr(state):
     """
     Tyr
     If main stack is empty, jump to next occurrence of the following codon.
     """
-    term, pointer = read_next_codon(pointer)
-    if VERBOSE:
-        print("Tyr", main_stack, aux_stack, term)
-    if not main_stack:
-        results = []
-        result, success = look_ahead(pointer, term)
+    term = CODONS[state.pointer % CHROMLEN]
+    state.pointer += 3
+    if not state.main:
+        result, success = look_ahead(state.pointer, term)
         if success:
-            results.append(result - pointer)
-        if results:
-            pointer += min(results) + 1
-    return(pointer, main_stack, aux_stack)
+            state.pointer = result + 1
 
 
-def gln(pointer, main_stack, aux_stack):
+def gln(state):
     """
     Gln
     If the main stack is empty, jump back to previous occurrence of the
     following codon.
     """
-    term, _ = read_next_codon(pointer)
-    if VERBOSE:
-        print("Gln", main_stack, aux_stack, term)
-    if not main_stack:
-        results = []
-        result, success = look_back(pointer, term)
-
+    term = CODONS[state.pointer % CHROMLEN]
+    if not state.main:
+        result, success = look_back(state.pointer, term)
         if success:
-            results.append(pointer - result)
-
-        if results:
-            pointer -= min(results) - 1
+            state.pointer = result + 1
         else:
-            pointer += 3
-    return(pointer, main_stack, aux_stack)
+            state.pointer += 3
 
 
-def asn(pointer, main_stack, aux_stack):
+def asn(state):
     """
     Asn
     Unconditionally jump to previous occurrence of the next codon.
     """
-    term, _ = read_next_codon(pointer)
-    if VERBOSE:
-        print("Asn", main_stack, aux_stack, term)
-    results = []
-    result, success = look_back(pointer, term)
-
+    term = CODONS[state.pointer % CHROMLEN]
+    result, success = look_back(state.pointer, term)
     if success:
-        results.append(pointer - result)
-
-    if results:
-        pointer -= min(results) - 1
+        state.pointer = result + 1
     else:
-        pointer += 3
-    return(pointer, main_stack, aux_stack)
+        state.pointer += 3
 
 
-def cys(pointer, main_stack, aux_stack):
+def cys(state):
     """
     Cys
     Unconditionally jump to next occurrence of the next codon.
     """
-    term, pointer = read_next_codon(pointer)
-    if VERBOSE:
-        print("Cys", main_stack, aux_stack, term)
-    results = []
-    result, success = look_ahead(pointer, term)
+    term = CODONS[state.pointer % CHROMLEN]
+    state.pointer += 3
+    result, success = look_ahead(state.pointer, term)
     if success:
-        results.append(result - pointer)
-    if results:
-        pointer += min(results) + 1
-    return(pointer, main_stack, aux_stack)
+        state.pointer = result + 1
+
+
+# Super-instructions: common pairs of amino acids, run as one
+
+
+def his_gly(state):
+    """
+    His, then Gly
+    Treat next codon as an integer literal in quaternary notation.
+    Push the value straight to the aux stack, skipping over the Gly.
+    """
+    state.aux.append(CODONS[state.pointer % CHROMLEN])
+    state.pointer += 6
 
 
 # Helper functions
 
 
-def codon_to_int(codon):
+def operands(state, default):
+    """
+    Get the top elements of the main and aux stacks as integers, for a
+    two-stack operation.
+    The aux element is removed, but the main element is left in place, to be
+    replaced by the result.
+    If either stack is empty, treat it as default.
+    """
+    main_stack, aux_stack = state.main, state.aux
+    if not main_stack:
+        main_stack.append(default)
+    # Stack values are almost always ints already, so only convert those that
+    # aren't (such as the floats produced by Pro)
+    if aux_stack:
+        b = aux_stack.pop()
+        if b.__class__ is not int:
+            b = int(b)
+    else:
+        b = default
+    a = main_stack[-1]
+    if a.__class__ is not int:
+        a = int(a)
+    return(a, b)
+
+
+def verbose(handler):
+    """
+    Wrap an amino acid function so that it prints the codon, its name, the
+    stacks, and any codon argument before running, for use when VERBOSE.
+    """
+    # Work out everything that doesn't depend on the state once, up front
+    name = handler.__name__.capitalize()
+    reads_codon = handler in READS_CODON
+
+    def verbose_handler(state):
+        # The codon itself has already been read by the main loop
+        print(read_next_codon(state.pointer - 3)[0])
+        if reads_codon:
+            print(name, state.main, state.aux,
+                  read_next_codon(state.pointer)[0])
+        else:
+            print(name, state.main, state.aux)
+        handler(state)
+
+    return verbose_handler
+
+
+def codon_idx(base0, base1, base2):
+    """
+    Convert three base byte values to a 6-bit codon index, for use with the
+    HANDLERS table.
+    """
+    return BASE[base0] << 4 | BASE[base1] << 2 | BASE[base2]
+
+
+def translate(handlers):
     """
-    Convert a quaternary codon to an integer, and return the result.
+    Translate the chromosome into a list of amino acid functions, giving the
+    handler for the codon starting at each position.
+    Every position is included, since jumps can land in any reading frame.
     """
-    codon = codon.lower()
-    i = 0
-    value = 0
-    for i in range(3):
-        char = codon[-i-1]
-        if char == 'a':
-            value += 0
-        elif char == 'c':
-            value += 1 * (4**i)
-        elif char == 'g':
-            value += 2 * (4**i)
-        elif char == 't':
-            value += 3 * (4**i)
+    return [handlers[codon] for codon in CODONS]
+
 
-    return value
+def fuse(program):
+    """
+    Replace each His whose literal is followed by Gly with the single
+    super-instruction his_gly.
+    Only the His position changes, so jumps landing on the Gly still find it.
+    """
+    fused = list(program)
+    for i in range(CHROMLEN):
+        if program[i] is his and program[(i + 6) % CHROMLEN] is gly:
+            fused[i] = his_gly
+    return fused
 
 
 def read_next_codon(pointer):
     """
     Read the next 3-digit codon
     """
-    codon = ""
-    for _ in range(3):
-        codon += CHROMOSOME[pointer % len(CHROMOSOME)].lower()
-        pointer += 1
-    return(codon, pointer)
+    # DOUBLED holds every codon contiguously, even those wrapping past the end,
+    # so only the start position needs reducing
+    start = pointer % CHROMLEN
+    codon = DOUBLED[start:start + 3].decode()
+    return(codon, pointer + 3)
+
+
+def find_codon(codon):
+    """
+    List the start positions of every occurrence of a codon (as a codon_idx)
+    in the chromosome, in ascending order.
+    The chromosome is only searched the first time each codon is asked for.
+    """
+    if POSITIONS[codon] is None:
+        needle = CODON_BYTES[codon]
+        positions = []
+        # Search with bytes.find, allowing occurrences to overlap
+        index = DOUBLED.find(needle, 0, CHROMLEN + 2)
+        while index != -1:
+            positions.append(index)
+            index = DOUBLED.find(needle, index + 1, CHROMLEN + 2)
+        POSITIONS[codon] = positions
+    return POSITIONS[codon]
 
 
-def look_ahead(pointer, search_term):
+def ahead_table(codon):
     """
-    Search forwards for a given string of length 3, and return the position of
-    the last character.
+    For every start position, give the last position of the first occurrence
+    of a codon starting there or later, looping back round to the beginning.
+    The table is indexed by the position two bases on from the start, as
+    look_ahead takes the position of the last character.
+    """
+    occurrences = find_codon(codon)
+    table = []
+    previous = -1
+    for occurrence in occurrences:
+        table.extend([(occurrence + 2) % CHROMLEN] * (occurrence - previous))
+        previous = occurrence
+    table.extend([(occurrences[0] + 2) % CHROMLEN] * (CHROMLEN - 1 - previous))
+    return table[-2:] + table[:-2]
+
+
+def back_table(codon):
+    """
+    For every start position, give the last position of the last occurrence
+    of a codon starting there or earlier, looping back round to the end.
+    The table is indexed by the position two bases on from the start, as
+    look_back takes the position of the last character.
+    """
+    occurrences = find_codon(codon)
+    table = [(occurrences[-1] + 2) % CHROMLEN] * occurrences[0]
+    for occurrence, following in zip(occurrences,
+                                      occurrences[1:] + [CHROMLEN]):
+        table.extend([(occurrence + 2) % CHROMLEN] * (following - occurrence))
+    return table[-2:] + table[:-2]
+
+
+def look_ahead(pointer, codon):
+    """
+    Search forwards for a given codon (as a codon_idx), and return the position
+    of the last character.
     Also return a boolean representing success.
     """
-    # Only loop back round to where we came from, then give up
-    for _ in range(len(CHROMOSOME)):
-        if (CHROMOSOME[pointer % len(CHROMOSOME)] == search_term[2] and
-                CHROMOSOME[(pointer-1) % len(CHROMOSOME)] == search_term[1] and
-                CHROMOSOME[(pointer-2) % len(CHROMOSOME)] == search_term[0]):
-            return(pointer, True)
-        pointer += 1
-    return(pointer, False)
+    if not find_codon(codon):
+        return(pointer, False)
+    # Build the table of answers for this codon the first time it is needed
+    if AHEAD_TABLES[codon] is None:
+        AHEAD_TABLES[codon] = ahead_table(codon)
+    # The pointer is never negative, and often already within the chromosome
+    if pointer >= CHROMLEN:
+        pointer %= CHROMLEN
+    return(AHEAD_TABLES[codon][pointer], True)
 
 
-def look_back(pointer, search_term):
+def look_back(pointer, codon):
     """
-    Search backwards for a given string of length 3, and return the position of
-    the last character.
+    Search backwards for a given codon (as a codon_idx), and return the
+    position of the last character.
     Also return a boolean representing success.
     """
-    # Only loop back round to where we came from, then give up
-    for _ in range(len(CHROMOSOME)):
-        if (CHROMOSOME[pointer % len(CHROMOSOME)] == search_term[2] and
-                CHROMOSOME[(pointer-1) % len(CHROMOSOME)] == search_term[1] and
-                CHROMOSOME[(pointer-2) % len(CHROMOSOME)] == search_term[0]):
-            return(pointer, True)
-        pointer -= 1
-    return(pointer, False)
+    if not find_codon(codon):
+        return(pointer, False)
+    # Build the table of answers for this codon the first time it is needed
+    if BACK_TABLES[codon] is None:
+        BACK_TABLES[codon] = back_table(codon)
+    # The pointer is never negative, and often already within the chromosome
+    if pointer >= CHROMLEN:
+        pointer %= CHROMLEN
+    return(BACK_TABLES[codon][pointer], True)
 
 
 # Define genetic code table
@@ -576,6 +602,37 @@ GENETIC_CODE = {
     'tgc': cys
 }
 
+# Map base byte values to their quaternary digits
+BASE = bytearray(256)
+BASE[ord('a')] = 0
+BASE[ord('c')] = 1
+BASE[ord('g')] = 2
+BASE[ord('t')] = 3
+
+# Translation table from bases to quaternary digits
+DIGITS = bytes.maketrans(b'acgt', b'\x00\x01\x02\x03')
+
+# There are only 64 codons, so convert each to an integer once
+CODON_INT = {bytes((base0, base1, base2)): codon_idx(base0, base1, base2)
+             for base0 in b'acgt' for base1 in b'acgt' for base2 in b'acgt'}
+# And each codon_idx back to its bases
+CODON_BYTES = sorted(CODON_INT, key=CODON_INT.get)
+
+# The genetic code as a jump table, indexed by codon_idx
+# Every one of the 64 codons has a meaning, so there are no gaps
+HANDLERS = [None] * 64
+for CODON, HANDLER in GENETIC_CODE.items():
+    HANDLERS[CODON_INT[CODON.encode()]] = HANDLER
+
+# The start codon, ATG, as a codon_idx
+START_CODON = CODON_INT[b'atg']
+
+# Amino acids which take the following codon as an argument
+READS_CODON = (his, ser, thr, tyr, gln, asn, cys)
+
+# The same table, with each amino acid reporting itself as it runs
+VERBOSE_HANDLERS = [verbose(HANDLER) for HANDLER in HANDLERS]
+
 
 # Main
 
@@ -585,55 +642,128 @@ def main():
     The main body of the interpreter
     """
 
-    main_stack = []
-    aux_stack = []
-    in_gene = False
+    # Start at the beginning, with empty stacks
+    state = State(0, [], [])
 
     # Push additional command line arguments to the stack
     for element in sys.argv[2:]:
         try:
             # Is the argument an integer?
-            main_stack.append(int(element))
+            state.main.append(int(element))
         except ValueError:
             # If not, treat it as a string & split it into characters, each of
             # which provides one integer.
-            for char in element:
-                main_stack.append(ord(char))
+            state.main.extend(map(ord, element))
 
-    # Start at the beginning
-    pointer = 0
+    # Translate the chromosome once, rather than decoding each codon as it is
+    # run (or testing VERBOSE every codon)
+    if VERBOSE:
+        program = translate(VERBOSE_HANDLERS)
+    else:
+        program = fuse(translate(HANDLERS))
+
+    # Look for a start codon
+    # If we can't find one, loop forever. This is deliberate.
+    in_gene = False
+    while not in_gene:
+        state.pointer, in_gene = look_ahead(state.pointer, START_CODON)
+        state.pointer += 1
+
+    # Once in a gene, we never leave it, so the interpreter loop need only
+    # dispatch codons
+    # Use local names in the loop, which are faster to look up than globals
+    length = CHROMLEN
+    # Include the first codon again at the end, so that His can read its
+    # argument without wrapping round
+    codons = CODONS + CODONS[:3]
+    # No amino acid replaces either stack, only modifies it, so these always
+    # refer to the current ones
+    main_stack = state.main
+    aux_stack = state.aux
 
     # Loop indefinitely (or until a stop codon)
     while True:
-        # Are we in a gene currently?
-        if in_gene:
-            # If so, read the next codon
-            codon, pointer = read_next_codon(pointer)
-            if VERBOSE:
-                print(codon)
-
-            # Do we know what this codon does?
-            if codon in GENETIC_CODE:
-                # If so, run the amino acid function
-                pointer, main_stack, aux_stack = GENETIC_CODE[codon](
-                    pointer, main_stack, aux_stack)
+        # Fetch the next codon's function from the translation
+        # The pointer only needs reducing once it runs off the end
+        pointer = state.pointer
+        if pointer >= length:
+            pointer %= length
+        handler = program[pointer]
+
+        # Run the commonest amino acids here, saving a function call
+        # (These behave exactly as their functions do, and are tested in order
+        # of how often they run in the example programs)
+        if handler is gly:
+            if main_stack:
+                aux_stack.append(main_stack.pop())
+            state.pointer = pointer + 3
+        elif handler is glu:
+            if main_stack:
+                main_stack.append(main_stack[-1])
+            state.pointer = pointer + 3
+        elif handler is his:
+            main_stack.append(codons[pointer + 3])
+            state.pointer = pointer + 6
+        elif handler is his_gly:
+            aux_stack.append(codons[pointer + 3])
+            state.pointer = pointer + 9
+        elif handler is leu:
+            if not main_stack:
+                main_stack.append(0)
+            a = main_stack[-1]
+            if a.__class__ is not int:
+                a = int(a)
+            if aux_stack:
+                b = aux_stack.pop()
+                if b.__class__ is not int:
+                    b = int(b)
+                a += b
+            main_stack[-1] = a
+            state.pointer = pointer + 3
+        elif handler is lys:
+            if main_stack:
+                print(main_stack.pop())
+            state.pointer = pointer + 3
         else:
-            # If not, look for a start codon
-            # If we can't find one, loop forever. This is deliberate.
-            pointer, in_gene = look_ahead(pointer, 'atg')
-            pointer += 1
+            state.pointer = pointer + 3
+            # Run the amino acid function
+            handler(state)
 
 
 VERBOSE = False
 
-# Get code, keeping only A, C, G, and T characters
+# Get code, as bytes
+# (No non-ASCII character lower-cases to a base, so those can be ignored)
 if len(sys.argv) > 1:
-    CHROMOSOME = re.sub(r'[^acgt]', '', sys.argv[1].lower())
+    USER_INPUT = sys.argv[1].encode('ascii', 'ignore')
 else:
     # If no program was specified as an argument, accept from standard input
-    while True:
-        USER_INPUT = ''.join([i for i in sys.stdin])
-        CHROMOSOME = re.sub(r'[^acgt]', '', USER_INPUT.lower())
+    # Read it all at once, so the program is prepared and run only once, and
+    # as raw bytes, since only the ASCII bases matter
+    USER_INPUT = sys.stdin.buffer.read()
+
+# Keep only A, C, G, and T characters, in lower case, in a single pass
+# The chromosome is stored as bytes, so indexing it yields small integers
+LOWER_CASE = bytes.maketrans(b'ACGT', b'acgt')
+NON_BASES = bytes(set(range(256)) - set(b'ACGTacgt'))
+CHROMOSOME = USER_INPUT.translate(LOWER_CASE, NON_BASES)
+CHROMLEN = len(CHROMOSOME)
+# The circular chromosome laid out twice (plus two bases), so that every
+# triple, including those wrapping past the end, is a contiguous substring
+DOUBLED = CHROMOSOME + CHROMOSOME + CHROMOSOME[:2]
+# The codon_idx of the codon starting at each position, so that amino acids
+# can read their arguments without decoding them
+# This is built from the chromosome as a stream of quaternary digits, with
+# the two extra bases needed to complete the codons that wrap round
+CODE_STREAM = DOUBLED[:CHROMLEN + 2].translate(DIGITS)
+CODONS = array.array('B', [digit0 << 4 | digit1 << 2 | digit2
+                           for digit0, digit1, digit2 in zip(
+                               CODE_STREAM, CODE_STREAM[1:], CODE_STREAM[2:])])
+# Where each codon occurs, for look_ahead and look_back, found as needed
+POSITIONS = [None] * 64
+# Answers to look_ahead and look_back for each codon, built as needed
+AHEAD_TABLES = [None] * 64
+BACK_TABLES = [None] * 64
 
 # Run interpreter
 main()